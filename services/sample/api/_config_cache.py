@@ -0,0 +1,133 @@
+"""Cached loading of the MCP tool configuration."""
+
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+import yaml
+
+try:
+    # libyaml's C parser is a drop-in replacement for the pure-Python one and
+    # several times faster; fall back when PyYAML was built without it.
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Maps path -> (mtime, size, parsed config). The config file is small and
+# effectively static between deploys, so re-parsing it per request is wasted
+# work; mtime+size invalidation keeps edits during development visible.
+_cache: Dict[str, Tuple[float, int, Dict[str, Any]]] = {}
+
+
+def load_mcp_config(path: str) -> Dict[str, Any]:
+    """Load and cache an MCP configuration file.
+
+    The parsed config is cached in-process and only re-read when the file's
+    mtime or size changes. Callers must treat the returned dict as read-only;
+    it is shared between all callers.
+
+    Args:
+        path: Path to the MCP configuration YAML file.
+
+    Returns:
+        The parsed configuration.
+    """
+    st = os.stat(path)
+    key = (st.st_mtime, st.st_size)
+
+    cached = _cache.get(path)
+    if cached is not None and cached[:2] == key:
+        return cached[2]
+
+    with open(path, "rb") as f:
+        raw = f.read()
+    config = _load_with_sidecar(path, raw)
+
+    _cache[path] = (key[0], key[1], config)
+    return config
+
+
+def _load_with_sidecar(path: str, raw: bytes) -> Dict[str, Any]:
+    """Parse config bytes, preferring a content-addressed JSON sidecar.
+
+    JSON parses an order of magnitude faster than YAML, so the parsed config
+    is persisted next to the YAML file as ``<stem>.<hash>.json``; subsequent
+    cold starts load the sidecar and skip the YAML parser entirely. The hash
+    covers the YAML content, so editing the file naturally invalidates it.
+    """
+    digest = hashlib.blake2b(raw, digest_size=8).hexdigest()
+    sidecar = f"{os.path.splitext(path)[0]}.{digest}.json"
+
+    try:
+        with open(sidecar, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        pass
+
+    config = yaml.load(raw, Loader=_Loader)
+
+    # Write the sidecar atomically; failure to persist is not fatal
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".json")
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(config))
+        os.replace(tmp_path, sidecar)
+    except OSError:
+        pass
+
+    return config
+
+
+# Manual __slots__ rather than dataclass(slots=True), which needs Python
+# 3.10+ (the deployment image runs 3.9). That rules out field defaults —
+# they would conflict with the same-named slots — so all fields are
+# required and build_registry supplies the defaults.
+@dataclass(frozen=True)
+class ToolSpec:
+    """Immutable definition of a configured MCP tool."""
+    __slots__ = ("name", "description", "input_schema", "output_schema")
+    name: str
+    description: str
+    input_schema: Optional[Dict[str, Any]]
+    output_schema: Optional[Dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class ResourceSpec:
+    """Immutable definition of a configured MCP resource."""
+    __slots__ = ("uri", "description")
+    uri: str
+    description: str
+
+
+def build_registry(
+    config: Dict[str, Any],
+) -> Tuple[Dict[str, ToolSpec], Dict[str, ResourceSpec]]:
+    """Index a parsed MCP config into hash-addressable spec tables.
+
+    Args:
+        config: The parsed MCP configuration.
+
+    Returns:
+        A (tools_by_name, resources_by_uri) pair of dicts.
+    """
+    tools = {
+        t["name"]: ToolSpec(
+            name=t["name"],
+            description=t.get("description", ""),
+            input_schema=t.get("input_schema"),
+            output_schema=t.get("output_schema"),
+        )
+        for t in config.get("tools", [])
+    }
+    resources = {
+        r["uri"]: ResourceSpec(
+            uri=r["uri"],
+            description=r.get("description", ""),
+        )
+        for r in config.get("resources", [])
+    }
+    return tools, resources
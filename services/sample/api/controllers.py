@@ -1,7 +1,9 @@
 import os
-import yaml
 from typing import Dict, Any
 
+import orjson
+
+from services.sample.api._config_cache import load_mcp_config
 from services.sample.domain.use_cases import GreetingUseCase, CalculationUseCase
 
 
@@ -40,18 +42,26 @@ class HealthController:
 
 class InfoController:
     """Controller for info-related endpoints."""
-    
-    def get_info(self) -> Dict[str, Any]:
-        """Get information about the service."""
-        # Load MCP configuration to include tools
+
+    def __init__(self):
+        # The config is static between restarts, so assemble the response
+        # once and serve cached copies (dict for MCP dispatch, pre-encoded
+        # JSON bytes for the HTTP endpoint).
         config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "mcp_tool.yaml")
-        with open(config_path, "r") as f:
-            mcp_config = yaml.safe_load(f)
-        
-        return {
+        mcp_config = load_mcp_config(config_path)
+        self._info = {
             "name": mcp_config.get("name", "sample-mcp"),
             "version": mcp_config.get("version", "0.1.0"),
             "description": mcp_config.get("description", "Sample MCP server with clean architecture"),
             "tools": mcp_config.get("tools", []),
             "resources": mcp_config.get("resources", [])
         }
+        self._info_json = orjson.dumps(self._info)
+
+    def get_info(self) -> Dict[str, Any]:
+        """Get information about the service."""
+        return self._info
+
+    def get_info_json(self) -> bytes:
+        """Get the service information as pre-encoded JSON bytes."""
+        return self._info_json
@@ -25,11 +25,11 @@ def get_settings() -> Settings:
     # Create service settings
     settings = Settings()
     
-    # Update with service-specific settings
-    settings_dict = settings.dict()
-    for key, value in settings_dict.items():
+    # Update with service-specific settings; iterate the declared fields
+    # directly instead of paying for a full .dict() serialization
+    for key in Settings.model_fields:
         if hasattr(base_settings, key):
-            setattr(base_settings, key, value)
+            setattr(base_settings, key, getattr(settings, key))
     
     return base_settings
 
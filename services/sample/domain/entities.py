@@ -6,6 +6,9 @@ from typing import Literal, Union, Optional
 @dataclass
 class Greeting:
     """Greeting entity."""
+    # Manual __slots__ rather than dataclass(slots=True), which needs
+    # Python 3.10+; the deployment image runs 3.9
+    __slots__ = ("name", "greeting", "timestamp")
     name: str
     greeting: str
     timestamp: datetime
@@ -14,6 +17,9 @@ class Greeting:
 @dataclass
 class Calculation:
     """Calculation entity."""
+    # No __slots__ here: the defaulted field would conflict with the slot
+    # of the same name on Python 3.9, where dataclasses cannot rebuild the
+    # class the way slots=True does on 3.10+
     operation: Literal["add", "subtract", "multiply", "divide"]
     a: float
     b: float
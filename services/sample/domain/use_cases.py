@@ -1,26 +1,29 @@
+import operator
 from datetime import datetime
 from typing import Dict, Any
 
 from services.sample.domain.entities import Greeting, Calculation
 
+# Table-driven dispatch: one dict lookup plus a C-level binary op instead of
+# chained string comparisons
+_OPERATIONS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+}
+
 
 class GreetingUseCase:
     """Use case for generating greetings."""
     
     def generate_greeting(self, name: str) -> Dict[str, Any]:
         """Generate a greeting for the given name."""
-        greeting_text = f"Hello, {name}! Welcome to the MCP sample service."
-        now = datetime.now()
-        
-        greeting = Greeting(
-            name=name,
-            greeting=greeting_text,
-            timestamp=now
-        )
-        
+        # Build the response dict directly; constructing a Greeting entity
+        # per request adds allocation without adding information
         return {
-            "greeting": greeting.greeting,
-            "timestamp": greeting.timestamp.isoformat()
+            "greeting": f"Hello, {name}! Welcome to the MCP sample service.",
+            "timestamp": datetime.now().isoformat()
         }
 
 
@@ -29,26 +32,14 @@ class CalculationUseCase:
     
     def calculate(self, operation: str, a: float, b: float) -> Dict[str, Any]:
         """Perform a calculation based on the given operation and operands."""
-        calculation = Calculation(
-            operation=operation,
-            a=a,
-            b=b
-        )
-        
-        if operation == "add":
-            calculation.result = a + b
-        elif operation == "subtract":
-            calculation.result = a - b
-        elif operation == "multiply":
-            calculation.result = a * b
-        elif operation == "divide":
-            if b == 0:
-                raise ValueError("Cannot divide by zero")
-            calculation.result = a / b
-        else:
+        op = _OPERATIONS.get(operation)
+        if op is None:
             raise ValueError(f"Unknown operation: {operation}")
-        
+
+        if operation == "divide" and not b:
+            raise ValueError("Cannot divide by zero")
+
         return {
-            "result": calculation.result,
-            "operation": calculation.operation
+            "result": op(a, b),
+            "operation": operation
         }
@@ -1,4 +1,5 @@
 import logging
+from functools import cached_property, lru_cache
 from typing import Dict, Any, Optional
 
 from services.sample.api.controllers import (
@@ -13,57 +14,91 @@ logger = logging.getLogger(__name__)
 
 class MCPHandler:
     """Handler for MCP requests."""
-    
+
     def __init__(self):
         logger.info("Initializing MCP handler")
-        self.greeting_controller = GreetingController()
-        self.calculation_controller = CalculationController()
-        self.health_controller = HealthController()
-        self.info_controller = InfoController()
-    
+        # Precomputed dispatch tables: a single dict lookup per request
+        # instead of chained string comparisons. Controllers themselves are
+        # cached properties, so nothing heavy is built until first use.
+        self._tool_dispatch = {
+            "get_greeting": self._handle_get_greeting,
+            "calculate": self._handle_calculate,
+        }
+        self._resource_dispatch = {
+            "/health": self._handle_health,
+            "/info": self._handle_info,
+        }
+
+    @cached_property
+    def greeting_controller(self) -> GreetingController:
+        return GreetingController()
+
+    @cached_property
+    def calculation_controller(self) -> CalculationController:
+        return CalculationController()
+
+    @cached_property
+    def health_controller(self) -> HealthController:
+        return HealthController()
+
+    @cached_property
+    def info_controller(self) -> InfoController:
+        return InfoController()
+
+    def _handle_health(self) -> Dict[str, Any]:
+        return self.health_controller.get_health()
+
+    def _handle_info(self) -> Dict[str, Any]:
+        return self.info_controller.get_info()
+
+    def _handle_get_greeting(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        logger.info("Processing get_greeting for name: %s", arguments.get("name"))
+        return self.greeting_controller.get_greeting(name=arguments["name"])
+
+    def _handle_calculate(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        logger.info(
+            "Processing calculation: %s with operands %s and %s",
+            arguments.get("operation"), arguments.get("a"), arguments.get("b"),
+        )
+        return self.calculation_controller.calculate(
+            operation=arguments["operation"],
+            a=arguments["a"],
+            b=arguments["b"]
+        )
+
     async def handle_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Handle an MCP tool request."""
-        logger.debug(f"Handling tool: {tool_name} with arguments: {arguments}")
-        
+        logger.debug("Handling tool: %s with arguments: %s", tool_name, arguments)
+
         try:
-            if tool_name == "get_greeting":
-                logger.info(f"Processing get_greeting for name: {arguments.get('name')}")
-                return self.greeting_controller.get_greeting(name=arguments["name"])
-            elif tool_name == "calculate":
-                logger.info(f"Processing calculation: {arguments.get('operation')} with operands {arguments.get('a')} and {arguments.get('b')}")
-                return self.calculation_controller.calculate(
-                    operation=arguments["operation"],
-                    a=arguments["a"],
-                    b=arguments["b"]
-                )
-            else:
-                logger.warning(f"Unknown tool requested: {tool_name}")
+            handler = self._tool_dispatch.get(tool_name)
+            if handler is None:
+                logger.warning("Unknown tool requested: %s", tool_name)
                 raise ValueError(f"Unknown tool: {tool_name}")
+            return handler(arguments)
         except KeyError as e:
-            logger.error(f"Missing required argument for {tool_name}: {e}")
+            logger.error("Missing required argument for %s: %s", tool_name, e)
             raise ValueError(f"Missing required argument: {e}")
         except Exception as e:
-            logger.error(f"Error handling tool {tool_name}: {e}", exc_info=True)
+            logger.error("Error handling tool %s: %s", tool_name, e, exc_info=True)
             raise
-    
+
     async def handle_resource(self, uri: str) -> Dict[str, Any]:
         """Handle an MCP resource request."""
-        logger.debug(f"Handling resource: {uri}")
-        
+        logger.debug("Handling resource: %s", uri)
+
         try:
-            if uri == "/health":
-                logger.info("Processing health check")
-                return self.health_controller.get_health()
-            elif uri == "/info":
-                logger.info("Processing info request")
-                return self.info_controller.get_info()
-            else:
-                logger.warning(f"Unknown resource URI requested: {uri}")
+            handler = self._resource_dispatch.get(uri)
+            if handler is None:
+                logger.warning("Unknown resource URI requested: %s", uri)
                 raise ValueError(f"Unknown resource URI: {uri}")
+            return handler()
         except Exception as e:
-            logger.error(f"Error handling resource {uri}: {e}", exc_info=True)
+            logger.error("Error handling resource %s: %s", uri, e, exc_info=True)
             raise
 
 
-# Create a singleton instance
-mcp_handler = MCPHandler()
+@lru_cache(maxsize=1)
+def get_mcp_handler() -> MCPHandler:
+    """Get the shared MCPHandler instance, constructing it on first use."""
+    return MCPHandler()
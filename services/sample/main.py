@@ -1,78 +1,127 @@
 import os
-import yaml
 import logging
+
+import orjson
 from fastapi import FastAPI, Request, HTTPException, Depends, Body
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
+from typing import Literal
+
 from pydantic import BaseModel
 import uvicorn
 
+from services.sample.api._config_cache import build_registry, load_mcp_config as _load_mcp_config
+from services.sample.api.controllers import HealthController
 from services.sample.config import get_settings, setup_app_logging
-from services.sample.handler import mcp_handler
+from services.sample.handler import MCPHandler, get_mcp_handler
 from shared.responses.api_response import APIResponse, ErrorResponse, ErrorDetail
 from shared.responses.mcp_response import MCPResponse
 from shared.llms import create_mcp_tool_client
+from shared.llms.mcp_client import MCPToolClient, aclose_all
 
 # Set up logging
 setup_app_logging()
 logger = logging.getLogger(__name__)
 
+# Resolve settings once at module scope
+_settings = get_settings()
+
 
 # Create FastAPI app
 app = FastAPI(
-    title=get_settings().APP_NAME,
-    description=get_settings().APP_DESCRIPTION,
-    version=get_settings().APP_VERSION,
+    title=_settings.APP_NAME,
+    description=_settings.APP_DESCRIPTION,
+    version=_settings.APP_VERSION,
+    default_response_class=ORJSONResponse,
 )
 
+# Create a single long-lived MCP tool client at startup so the underlying
+# httpx connection pool is reused across requests instead of being rebuilt
+# (TCP/TLS handshake and all) on every /llm/process call
+@app.on_event("startup")
+async def startup_mcp_client():
+    app.state.mcp_client = await create_mcp_tool_client()
+
+
+# Construct the MCP handler at startup rather than import time so importing
+# this module (tests, tooling) stays cheap
+@app.on_event("startup")
+async def startup_mcp_handler():
+    app.state.mcp_handler = get_mcp_handler()
+
+
+def get_handler(request: Request) -> MCPHandler:
+    """Dependency returning the shared MCP handler."""
+    return request.app.state.mcp_handler
+
+
+@app.on_event("shutdown")
+async def shutdown_mcp_client():
+    await app.state.mcp_client.close()
+    await aclose_all()
+
+
+def get_mcp_client(request: Request) -> MCPToolClient:
+    """Dependency returning the shared MCP tool client."""
+    return request.app.state.mcp_client
+
+
 # Add exception handlers
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle validation errors."""
-    logger.error(f"Validation error: {exc}")
+    logger.error("Validation error: %s", exc)
     details = []
     for error in exc.errors():
         details.append(
             ErrorDetail(
-                loc=error.get("loc", []),
+                # loc tuples mix strings and ints (e.g. ('body', 0) for
+                # malformed JSON); coerce for the List[str] model field
+                loc=[str(part) for part in error.get("loc", [])],
                 msg=error.get("msg", ""),
                 type=error.get("type", ""),
             )
         )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,
         content=APIResponse.error(
             message="Validation Error",
             code=422,
             details=details,
-        ).model_dump(),
+        ).model_dump(mode="json"),
     )
 
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions."""
-    logger.error(f"HTTP error: {exc.status_code} - {exc.detail}")
-    return JSONResponse(
+    logger.error("HTTP error: %s - %s", exc.status_code, exc.detail)
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=APIResponse.error(
             message=exc.detail,
             code=exc.status_code,
-        ).model_dump(),
+        ).model_dump(mode="json"),
     )
 
 
+# Pre-serialized bodies for fully static error responses: the generic 500
+# path should not pay for pydantic construction and JSON encoding per error
+_ISE_BODY = orjson.dumps(
+    APIResponse.error(message="Internal Server Error", code=500).model_dump(mode="json")
+)
+_MCP_ISE_BODY = orjson.dumps(MCPResponse.error_response("Internal Server Error"))
+
+
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions."""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
+    return Response(
         status_code=500,
-        content=APIResponse.error(
-            message="Internal Server Error",
-            code=500,
-        ).model_dump(),
+        content=_ISE_BODY,
+        media_type="application/json",
     )
 
 # Add CORS middleware
@@ -87,111 +136,199 @@ app.add_middleware(
 
 # Load MCP configuration
 def load_mcp_config():
-    """Load MCP configuration from YAML file."""
+    """Load MCP configuration from YAML file (cached)."""
     config_path = os.path.join(os.path.dirname(__file__), "mcp_tool.yaml")
-    with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+    return _load_mcp_config(config_path)
 
 
 mcp_config = load_mcp_config()
 
+# Typed, immutable spec tables indexed by name/URI for O(1) lookups on the
+# request path
+_tools, _resources = build_registry(mcp_config)
+
+
+# Typed argument models for the known tools. Declaring the bodies lets
+# FastAPI validate argument shapes during request decoding, so the handler
+# does no second pass over the arguments.
+class GreetingArgs(BaseModel):
+    """Arguments for the get_greeting tool."""
+
+    name: str
+
+
+class CalcArgs(BaseModel):
+    """Arguments for the calculate tool."""
+
+    operation: Literal["add", "subtract", "multiply", "divide"]
+    a: float
+    b: float
+
+
+# MCP endpoints. The typed routes are declared before the generic
+# /mcp/tool/{tool_name} route so they take precedence for known tools.
+@app.post("/mcp/tool/get_greeting")
+async def mcp_tool_get_greeting(
+    args: GreetingArgs,
+    handler: MCPHandler = Depends(get_handler),
+):
+    """Handle get_greeting tool requests with a validated body."""
+    logger.info("Received MCP tool request: get_greeting")
+    try:
+        result = handler.greeting_controller.get_greeting(name=args.name)
+        return Response(
+            content=MCPResponse.success_json(result),
+            media_type="application/json",
+        )
+    except Exception as e:
+        logger.error("Error executing tool get_greeting: %s", e, exc_info=True)
+        return Response(
+            status_code=500,
+            content=_MCP_ISE_BODY,
+            media_type="application/json",
+        )
+
+
+@app.post("/mcp/tool/calculate")
+async def mcp_tool_calculate(
+    args: CalcArgs,
+    handler: MCPHandler = Depends(get_handler),
+):
+    """Handle calculate tool requests with a validated body."""
+    logger.info("Received MCP tool request: calculate")
+    try:
+        result = handler.calculation_controller.calculate(
+            operation=args.operation, a=args.a, b=args.b
+        )
+        return Response(
+            content=MCPResponse.success_json(result),
+            media_type="application/json",
+        )
+    except ValueError as e:
+        logger.error("Value error in tool calculate: %s", e)
+        return Response(
+            status_code=400,
+            content=MCPResponse.error_json(str(e)),
+            media_type="application/json",
+        )
+    except Exception as e:
+        logger.error("Error executing tool calculate: %s", e, exc_info=True)
+        return Response(
+            status_code=500,
+            content=_MCP_ISE_BODY,
+            media_type="application/json",
+        )
+
 
-# MCP endpoints
 @app.post("/mcp/tool/{tool_name}")
-async def mcp_tool(tool_name: str, request: Request):
+async def mcp_tool(
+    tool_name: str,
+    request: Request,
+    handler: MCPHandler = Depends(get_handler),
+):
     """Handle MCP tool requests."""
-    logger.info(f"Received MCP tool request: {tool_name}")
+    logger.info("Received MCP tool request: %s", tool_name)
     
     # Check if tool exists in configuration
-    tool_exists = False
-    for tool in mcp_config.get("tools", []):
-        if tool["name"] == tool_name:
-            tool_exists = True
-            break
-    
-    if not tool_exists:
-        logger.warning(f"Tool not found: {tool_name}")
+    if tool_name not in _tools:
+        logger.warning("Tool not found: %s", tool_name)
         raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
     
     # Parse request body
     try:
         arguments = await request.json()
-        logger.debug(f"Tool arguments: {arguments}")
+        logger.debug("Tool arguments: %s", arguments)
     except Exception as e:
-        logger.error(f"Invalid JSON body: {e}")
+        logger.error("Invalid JSON body: %s", e)
         raise HTTPException(status_code=400, detail="Invalid JSON body")
     
     # Handle tool request
     try:
-        result = await mcp_handler.handle_tool(tool_name, arguments)
-        logger.info(f"Tool {tool_name} executed successfully")
-        return JSONResponse(content=MCPResponse.success_response(result))
+        result = await handler.handle_tool(tool_name, arguments)
+        logger.info("Tool %s executed successfully", tool_name)
+        return Response(
+            content=MCPResponse.success_json(result),
+            media_type="application/json",
+        )
     except ValueError as e:
-        logger.error(f"Value error in tool {tool_name}: {e}")
-        return JSONResponse(
+        logger.error("Value error in tool %s: %s", tool_name, e)
+        return Response(
             status_code=400,
-            content=MCPResponse.error_response(str(e)),
+            content=MCPResponse.error_json(str(e)),
+            media_type="application/json",
         )
     except Exception as e:
-        logger.error(f"Error executing tool {tool_name}: {e}", exc_info=True)
-        return JSONResponse(
+        logger.error("Error executing tool %s: %s", tool_name, e, exc_info=True)
+        return Response(
             status_code=500,
-            content=MCPResponse.error_response("Internal Server Error"),
+            content=_MCP_ISE_BODY,
+            media_type="application/json",
         )
 
 
 @app.get("/mcp/resource{uri:path}")
-async def mcp_resource(uri: str):
+async def mcp_resource(uri: str, handler: MCPHandler = Depends(get_handler)):
     """Handle MCP resource requests."""
-    logger.info(f"Received MCP resource request: {uri}")
+    logger.info("Received MCP resource request: %s", uri)
     
     # Check if resource exists in configuration
-    resource_exists = False
-    for resource in mcp_config.get("resources", []):
-        if resource["uri"] == uri:
-            resource_exists = True
-            break
-    
-    if not resource_exists:
-        logger.warning(f"Resource not found: {uri}")
+    if uri not in _resources:
+        logger.warning("Resource not found: %s", uri)
         raise HTTPException(status_code=404, detail=f"Resource '{uri}' not found")
     
     # Handle resource request
     try:
-        result = await mcp_handler.handle_resource(uri)
-        logger.info(f"Resource {uri} accessed successfully")
-        return JSONResponse(content=MCPResponse.success_response(result))
+        result = await handler.handle_resource(uri)
+        logger.info("Resource %s accessed successfully", uri)
+        return Response(
+            content=MCPResponse.success_json(result),
+            media_type="application/json",
+        )
     except ValueError as e:
-        logger.error(f"Value error in resource {uri}: {e}")
-        return JSONResponse(
+        logger.error("Value error in resource %s: %s", uri, e)
+        return Response(
             status_code=400,
-            content=MCPResponse.error_response(str(e)),
+            content=MCPResponse.error_json(str(e)),
+            media_type="application/json",
         )
     except Exception as e:
-        logger.error(f"Error accessing resource {uri}: {e}", exc_info=True)
-        return JSONResponse(
+        logger.error("Error accessing resource %s: %s", uri, e, exc_info=True)
+        return Response(
             status_code=500,
-            content=MCPResponse.error_response("Internal Server Error"),
+            content=_MCP_ISE_BODY,
+            media_type="application/json",
         )
 
 
+# The health payload is constant, and load balancers and monitors hit this
+# endpoint constantly: serve bytes encoded once at import. The timestamp in
+# the cached body therefore reflects process start.
+_HEALTH_BODY = orjson.dumps(
+    APIResponse.success(
+        data=HealthController().get_health()
+    ).model_dump(mode="json")
+)
+
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
     logger.info("Health check requested")
-    result = await mcp_handler.handle_resource("/health")
-    return APIResponse.success(data=result)
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 # Info endpoint
 @app.get("/info")
-async def info():
+async def info(handler: MCPHandler = Depends(get_handler)):
     """Info endpoint."""
     logger.info("Info requested")
-    result = await mcp_handler.handle_resource("/info")
-    # Return raw result for MCP client compatibility
-    return result
+    # Return the pre-encoded raw payload for MCP client compatibility,
+    # skipping re-serialization entirely
+    return Response(
+        content=handler.info_controller.get_info_json(),
+        media_type="application/json",
+    )
 
 
 # LLM request model
@@ -206,30 +343,26 @@ class LLMRequest(BaseModel):
 
 # LLM endpoint
 @app.post("/llm/process")
-async def process_with_llm(request: LLMRequest):
+async def process_with_llm(
+    llm_request: LLMRequest,
+    mcp_client: MCPToolClient = Depends(get_mcp_client),
+):
     """Process a prompt with the LLM and call MCP tools as needed."""
-    logger.info(f"Received LLM request with prompt: {request.prompt}")
-    
+    logger.info("Received LLM request with prompt: %s", llm_request.prompt)
+
     try:
-        # Create the MCP tool client
-        mcp_client = await create_mcp_tool_client()
-        
-        try:
-            # Process the prompt with the LLM
-            result = await mcp_client.process_with_llm(
-                prompt=request.prompt,
-                system_message=request.system_message,
-                temperature=request.temperature,
-                max_tokens=request.max_tokens,
-            )
-            
-            logger.info("LLM request processed successfully")
-            return APIResponse.success(data=result)
-        finally:
-            # Close the MCP tool client
-            await mcp_client.close()
+        # Process the prompt with the shared LLM client
+        result = await mcp_client.process_with_llm(
+            prompt=llm_request.prompt,
+            system_message=llm_request.system_message,
+            temperature=llm_request.temperature,
+            max_tokens=llm_request.max_tokens,
+        )
+
+        logger.info("LLM request processed successfully")
+        return APIResponse.success(data=result)
     except Exception as e:
-        logger.error(f"Error processing LLM request: {e}", exc_info=True)
+        logger.error("Error processing LLM request: %s", e, exc_info=True)
         return APIResponse.error(
             message=f"Error processing LLM request: {str(e)}",
             code=500,
@@ -254,10 +387,10 @@ async def root():
 
 # Run the application
 if __name__ == "__main__":
-    logger.info(f"Starting application on {get_settings().HOST}:{get_settings().PORT}")
+    logger.info("Starting application on %s:%s", _settings.HOST, _settings.PORT)
     uvicorn.run(
         "services.sample.main:app",
-        host=get_settings().HOST,
-        port=get_settings().PORT,
-        reload=get_settings().DEBUG,
+        host=_settings.HOST,
+        port=_settings.PORT,
+        reload=_settings.DEBUG,
     )
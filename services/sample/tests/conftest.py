@@ -0,0 +1,19 @@
+"""Shared fixtures for the sample service tests."""
+
+import pytest_asyncio
+
+from shared.llms.factory import create_mcp_tool_client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def live_mcp_client():
+    """Session-scoped MCP tool client for integration tests.
+
+    Building the client sets up the LLM client and an httpx connection
+    pool, so integration tests against a running server should share one
+    instance rather than constructing a client per test. Unit tests keep
+    their own mocked ``mcp_client`` fixtures.
+    """
+    client = await create_mcp_tool_client()
+    yield client
+    await client.close()
@@ -0,0 +1,31 @@
+"""Tests for the HTTP API."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from services.sample.main import app
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Test client with startup/shutdown events fired."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.mark.parametrize("path", ["/mcp/tool/get_greeting", "/mcp/tool/calculate"])
+def test_malformed_json_returns_validation_error(client, path):
+    """Malformed JSON on the typed tool routes must not hit the 500 handler.
+
+    FastAPI reports it as a RequestValidationError whose loc contains
+    ints; the 422 handler has to cope with that.
+    """
+    response = client.post(
+        path,
+        content=b"{not json",
+        headers={"content-type": "application/json"},
+    )
+    assert response.status_code == 422
+    body = response.json()
+    assert body["status"] == "error"
+    assert body["details"]
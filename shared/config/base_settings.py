@@ -1,37 +1,43 @@
 """Base settings for all services."""
 
-import os
 from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import Field
+from pydantic_settings import BaseSettings as PydanticBaseSettings, SettingsConfigDict
 
 
-class BaseSettings(BaseModel):
-    """Base settings for all services."""
-    
+class BaseSettings(PydanticBaseSettings):
+    """Base settings for all services.
+
+    Environment variables are resolved by pydantic-settings at instance
+    construction, not frozen at import time the way the previous
+    ``os.getenv`` class-body defaults were.
+    """
+
     # App settings
     APP_NAME: str = "base-service"
     APP_VERSION: str = "0.1.0"
     APP_DESCRIPTION: str = "Base service"
-    
+
     # Server settings
-    HOST: str = os.getenv("HOST", "0.0.0.0")
-    PORT: int = int(os.getenv("PORT", "8000"))
-    DEBUG: bool = os.getenv("DEBUG", "False").lower() in ("true", "1", "t")
-    
+    HOST: str = Field(default="0.0.0.0")
+    PORT: int = Field(default=8000)
+    DEBUG: bool = Field(default=False)
+
     # Logging settings
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
-    LOG_FILE: Optional[str] = os.getenv("LOG_FILE")
-    LOG_FORMAT: str = os.getenv(
-        "LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    LOG_LEVEL: str = Field(default="INFO")
+    LOG_FILE: Optional[str] = Field(default=None)
+    LOG_FORMAT: str = Field(
+        default="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        extra="ignore",  # Allow extra fields in the environment
     )
-    
-    class Config:
-        """Pydantic config."""
-        env_file = ".env"
-        case_sensitive = True
 
 
 @lru_cache()
@@ -1,10 +1,11 @@
 """LLM configuration settings."""
 
 import os
+from functools import lru_cache
 from typing import Optional
 
-from pydantic import ConfigDict, Field, BaseModel
-from pydantic_settings import BaseSettings
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class LLMSettings(BaseSettings):
@@ -48,18 +49,20 @@ class LLMSettings(BaseSettings):
         description="Timeout for MCP requests in seconds",
     )
     
-    class Config:
-        """Pydantic config."""
-        
-        env_file = ".env"
-        case_sensitive = True
-        extra = "ignore"  # Allow extra fields in the environment
-    
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        extra="ignore",  # Allow extra fields in the environment
+    )
 
 
+@lru_cache()
 def get_llm_settings() -> LLMSettings:
-    """Get LLM settings.
-    
+    """Get cached LLM settings.
+
+    Tests that change the environment can call
+    ``get_llm_settings.cache_clear()`` to force a reload.
+
     Returns:
         LLM settings.
     """
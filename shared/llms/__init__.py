@@ -1,9 +1,19 @@
-"""LLM client module."""
+"""LLM client module.
+
+The concrete clients pull in heavy dependencies (the OpenAI SDK, httpx),
+so they are loaded lazily per PEP 562; importing this package only pays
+for the abstract base.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
 
 from shared.llms.client import LLMClient
-from shared.llms.openai_client import OpenAIClient
-from shared.llms.mcp_client import MCPToolClient
-from shared.llms.factory import create_llm_client, create_mcp_tool_client
+
+if TYPE_CHECKING:
+    from shared.llms.factory import create_llm_client, create_mcp_tool_client
+    from shared.llms.mcp_client import MCPToolClient
+    from shared.llms.openai_client import OpenAIClient
 
 __all__ = [
     "LLMClient",
@@ -12,3 +22,19 @@ __all__ = [
     "create_llm_client",
     "create_mcp_tool_client",
 ]
+
+_LAZY_ATTRS = {
+    "OpenAIClient": "shared.llms.openai_client",
+    "MCPToolClient": "shared.llms.mcp_client",
+    "create_llm_client": "shared.llms.factory",
+    "create_mcp_tool_client": "shared.llms.factory",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value  # cache so __getattr__ only runs once per name
+    return value
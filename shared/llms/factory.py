@@ -10,29 +10,42 @@ from shared.llms.mcp_client import MCPToolClient
 
 logger = logging.getLogger(__name__)
 
+# Cached LLM clients keyed by their construction parameters. Building an
+# OpenAI client sets up its own HTTP pool and config parsing, so reuse one
+# per configuration instead of rebuilding per call.
+_LLM_CLIENTS = {}
+
 
 async def create_llm_client() -> LLMClient:
-    """Create an LLM client based on the configuration.
-    
+    """Create (or reuse) an LLM client based on the configuration.
+
     Returns:
         An LLM client.
     """
     settings = get_llm_settings()
-    
-    if settings.LLM_PROVIDER.lower() == "openai":
-        logger.info(f"Creating OpenAI client with model {settings.OPENAI_MODEL}")
-        return OpenAIClient(
-            api_key=settings.OPENAI_API_KEY,
-            model=settings.OPENAI_MODEL,
-            organization=settings.OPENAI_ORGANIZATION,
-        )
+
+    key = (
+        settings.LLM_PROVIDER.lower(),
+        settings.OPENAI_API_KEY,
+        settings.OPENAI_MODEL,
+        settings.OPENAI_ORGANIZATION,
+    )
+    client = _LLM_CLIENTS.get(key)
+    if client is not None:
+        return client
+
+    if settings.LLM_PROVIDER.lower() != "openai":
+        logger.warning("Unknown LLM provider: %s, falling back to OpenAI", settings.LLM_PROVIDER)
     else:
-        logger.warning(f"Unknown LLM provider: {settings.LLM_PROVIDER}, falling back to OpenAI")
-        return OpenAIClient(
-            api_key=settings.OPENAI_API_KEY,
-            model=settings.OPENAI_MODEL,
-            organization=settings.OPENAI_ORGANIZATION,
-        )
+        logger.info("Creating OpenAI client with model %s", settings.OPENAI_MODEL)
+    client = OpenAIClient(
+        api_key=settings.OPENAI_API_KEY,
+        model=settings.OPENAI_MODEL,
+        organization=settings.OPENAI_ORGANIZATION,
+    )
+
+    _LLM_CLIENTS[key] = client
+    return client
 
 
 async def create_mcp_tool_client(
@@ -57,7 +70,7 @@ async def create_mcp_tool_client(
     base_url = base_url or settings.MCP_BASE_URL
     timeout = timeout or settings.MCP_TIMEOUT
     
-    logger.info(f"Creating MCP tool client with base URL: {base_url}")
+    logger.info("Creating MCP tool client with base URL: %s", base_url)
     return MCPToolClient(
         base_url=base_url,
         llm_client=llm_client,
@@ -1,8 +1,10 @@
 """MCP client that uses an LLM to call MCP tools."""
 
+import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import httpx
 
@@ -10,6 +12,47 @@ from shared.llms.client import LLMClient
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is in requirements
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads = json.loads
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+# Shared HTTP clients keyed by (base_url, timeout). MCPToolClient instances
+# talking to the same server reuse one keep-alive connection pool instead of
+# redoing TCP/TLS setup per instance.
+_SHARED_CLIENTS: Dict[Tuple[str, float], httpx.AsyncClient] = {}
+
+
+def _get_shared_client(base_url: str, timeout: float) -> httpx.AsyncClient:
+    """Get or create the shared HTTP client for a (base_url, timeout) pair."""
+    key = (base_url, timeout)
+    client = _SHARED_CLIENTS.get(key)
+    if client is None:
+        client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30.0),
+        )
+        _SHARED_CLIENTS[key] = client
+    return client
+
+
+async def aclose_all() -> None:
+    """Close all shared HTTP clients. Call once at application shutdown."""
+    clients = list(_SHARED_CLIENTS.values())
+    _SHARED_CLIENTS.clear()
+    for client in clients:
+        await client.aclose()
+
 
 class MCPToolClient:
     """Client for calling MCP tools."""
@@ -19,57 +62,111 @@ class MCPToolClient:
         base_url: str,
         llm_client: LLMClient,
         timeout: float = 30.0,
+        tools_ttl: float = 60.0,
     ):
         """Initialize the MCP tool client.
-        
+
         Args:
             base_url: The base URL of the MCP server.
             llm_client: The LLM client to use.
             timeout: The timeout for HTTP requests in seconds.
+            tools_ttl: How long (in seconds) the cached tool list is
+                considered fresh before a background refresh is triggered.
         """
         self.base_url = base_url.rstrip("/")
         self.llm_client = llm_client
         self.timeout = timeout
-        self.http_client = httpx.AsyncClient(timeout=timeout)
-        logger.info(f"Initialized MCP tool client with base URL: {base_url}")
-        
-        # Cache for tool definitions
+        self.http_client = _get_shared_client(self.base_url, timeout)
+        logger.info("Initialized MCP tool client with base URL: %s", base_url)
+
+        # Precomputed URL prefixes so the request path does string
+        # concatenation instead of f-string formatting per call
+        self._info_url = f"{self.base_url}/info"
+        self._tool_prefix = f"{self.base_url}/mcp/tool/"
+        self._resource_prefix = f"{self.base_url}/mcp/resource"
+
+        # Cache for tool definitions (stale-while-revalidate). The lock
+        # ensures a burst of concurrent cold-cache callers issues exactly
+        # one /info request.
         self._tools_cache = None
+        self._tools_cache_ts = 0.0
+        self._tools_ttl = tools_ttl
+        self._tools_refresh_task = None
+        self._tools_lock = asyncio.Lock()
+
+        # Memoized LLM-formatted tool list, keyed by identity of the raw
+        # tool list it was built from so any cache refresh invalidates it
+        self._llm_tools_cache = None
+        self._llm_tools_source = None
     
     async def close(self):
-        """Close the HTTP client."""
-        await self.http_client.aclose()
+        """Release this client.
+
+        The underlying HTTP client is shared between instances, so it is
+        left open here; call :func:`aclose_all` at application shutdown.
+        """
     
     async def get_tools(self) -> List[Dict[str, Any]]:
         """Get the available tools from the MCP server.
-        
+
+        The tool list is cached with a stale-while-revalidate policy: fresh
+        entries are returned directly, expired entries are returned
+        immediately while a background task refreshes them, and the stale
+        value keeps being served if the refresh fails.
+
         Returns:
             A list of tool definitions.
         """
         if self._tools_cache is not None:
+            if time.monotonic() - self._tools_cache_ts >= self._tools_ttl:
+                self._schedule_tools_refresh()
             return self._tools_cache
-        
+
+        # Double-checked cold path: only the first concurrent caller fetches
+        async with self._tools_lock:
+            if self._tools_cache is not None:
+                return self._tools_cache
+            tools = await self._fetch_tools()
+            if tools is not None:
+                self._tools_cache = tools
+                self._tools_cache_ts = time.monotonic()
+                return tools
+        return []
+
+    def _schedule_tools_refresh(self) -> None:
+        """Kick off a background refresh of the tool cache, at most one at a time."""
+        if self._tools_refresh_task is not None and not self._tools_refresh_task.done():
+            return
+        self._tools_refresh_task = asyncio.ensure_future(self._refresh_tools())
+
+    async def _refresh_tools(self) -> None:
+        """Refresh the tool cache, keeping the stale value on failure."""
+        tools = await self._fetch_tools()
+        if tools is not None:
+            self._tools_cache = tools
+            self._tools_cache_ts = time.monotonic()
+
+    async def _fetch_tools(self) -> Optional[List[Dict[str, Any]]]:
+        """Fetch the tool list from the MCP server, or None on failure."""
         try:
-            response = await self.http_client.get(f"{self.base_url}/info")
+            response = await self.http_client.get(self._info_url)
             response.raise_for_status()
-            
-            data = response.json()
-            
+
+            data = _json_loads(response.content)
+
             # Check for tools in different response structures
             if "data" in data and "tools" in data["data"]:
                 # Structure: {"data": {"tools": [...]}}
-                self._tools_cache = data["data"]["tools"]
-                return self._tools_cache
+                return data["data"]["tools"]
             elif "tools" in data:
                 # Structure: {"tools": [...]}
-                self._tools_cache = data["tools"]
-                return self._tools_cache
-            
+                return data["tools"]
+
             logger.warning("No tools found in MCP server response")
-            return []
+            return None
         except Exception as e:
-            logger.error(f"Error getting tools: {e}", exc_info=True)
-            return []
+            logger.error("Error getting tools: %s", e, exc_info=True)
+            return None
     
     async def call_tool(
         self,
@@ -86,25 +183,29 @@ class MCPToolClient:
             The tool response.
         """
         try:
-            logger.info(f"Calling tool {tool_name} with arguments: {arguments}")
+            logger.info("Calling tool %s with arguments: %s", tool_name, arguments)
             
             response = await self.http_client.post(
-                f"{self.base_url}/mcp/tool/{tool_name}",
-                json=arguments,
+                self._tool_prefix + tool_name,
+                content=_json_dumps(arguments),
+                headers=_JSON_HEADERS,
             )
-            response.raise_for_status()
-            
-            result = response.json()
-            logger.debug(f"Tool response: {result}")
-            
-            if not result.get("success", False):
-                error_msg = result.get("error", "Unknown error")
-                logger.error(f"Tool call failed: {error_msg}")
-                raise ValueError(f"Tool call failed: {error_msg}")
-            
-            return result.get("data", {})
+            # Cheap int compare on the hot path; only error responses pay
+            # for raise_for_status' bookkeeping
+            if response.status_code >= 400:
+                response.raise_for_status()
+
+            result = _json_loads(response.content)
+            logger.debug("Tool response: %s", result)
+
+            if result.get("success"):
+                return result.get("data", {})
+
+            error_msg = result.get("error", "Unknown error")
+            logger.error("Tool call failed: %s", error_msg)
+            raise ValueError(f"Tool call failed: {error_msg}")
         except Exception as e:
-            logger.error(f"Error calling tool {tool_name}: {e}", exc_info=True)
+            logger.error("Error calling tool %s: %s", tool_name, e, exc_info=True)
             raise
     
     async def call_resource(self, uri: str) -> Dict[str, Any]:
@@ -117,28 +218,29 @@ class MCPToolClient:
             The resource response.
         """
         try:
-            logger.info(f"Calling resource {uri}")
+            logger.info("Calling resource %s", uri)
             
             # Ensure the URI starts with a slash
             if not uri.startswith("/"):
                 uri = f"/{uri}"
             
             response = await self.http_client.get(
-                f"{self.base_url}/mcp/resource{uri}",
+                self._resource_prefix + uri,
             )
-            response.raise_for_status()
-            
-            result = response.json()
-            logger.debug(f"Resource response: {result}")
-            
-            if not result.get("success", False):
-                error_msg = result.get("error", "Unknown error")
-                logger.error(f"Resource call failed: {error_msg}")
-                raise ValueError(f"Resource call failed: {error_msg}")
-            
-            return result.get("data", {})
+            if response.status_code >= 400:
+                response.raise_for_status()
+
+            result = _json_loads(response.content)
+            logger.debug("Resource response: %s", result)
+
+            if result.get("success"):
+                return result.get("data", {})
+
+            error_msg = result.get("error", "Unknown error")
+            logger.error("Resource call failed: %s", error_msg)
+            raise ValueError(f"Resource call failed: {error_msg}")
         except Exception as e:
-            logger.error(f"Error calling resource {uri}: {e}", exc_info=True)
+            logger.error("Error calling resource %s: %s", uri, e, exc_info=True)
             raise
     
     async def _format_tools_for_llm(self) -> List[Dict[str, Any]]:
@@ -148,7 +250,10 @@ class MCPToolClient:
             A list of tool definitions formatted for the LLM.
         """
         tools = await self.get_tools()
-        
+
+        if tools is self._llm_tools_source:
+            return self._llm_tools_cache
+
         llm_tools = []
         for tool in tools:
             llm_tool = {
@@ -160,7 +265,9 @@ class MCPToolClient:
                 }
             }
             llm_tools.append(llm_tool)
-        
+
+        self._llm_tools_source = tools
+        self._llm_tools_cache = llm_tools
         return llm_tools
     
     async def process_with_llm(
@@ -207,34 +314,43 @@ class MCPToolClient:
         # Process any tool calls
         tool_results = None
         if llm_response.get("tool_calls"):
-            tool_results = []
-            
-            for tool_call in llm_response["tool_calls"]:
-                if tool_call["type"] == "function":
-                    function = tool_call["function"]
-                    tool_name = function["name"]
-                    
-                    try:
-                        # Parse the arguments
-                        arguments = json.loads(function["arguments"])
-                        
-                        # Call the tool
-                        result = await self.call_tool(tool_name, arguments)
-                        
-                        tool_results.append({
-                            "tool_name": tool_name,
-                            "arguments": arguments,
-                            "result": result,
-                            "error": None,
-                        })
-                    except Exception as e:
-                        logger.error(f"Error calling tool {tool_name}: {e}", exc_info=True)
-                        tool_results.append({
-                            "tool_name": tool_name,
-                            "arguments": json.loads(function["arguments"]) if function["arguments"] else {},
-                            "result": None,
-                            "error": str(e),
-                        })
+
+            async def _invoke(tool_call: Dict[str, Any]) -> Dict[str, Any]:
+                function = tool_call["function"]
+                tool_name = function["name"]
+
+                # Parse the arguments once, up front; the error branch
+                # reuses them instead of re-parsing (which could itself
+                # raise inside the except handler)
+                arguments = json.loads(function["arguments"]) if function["arguments"] else {}
+
+                try:
+                    # Call the tool
+                    result = await self.call_tool(tool_name, arguments)
+                    return {
+                        "tool_name": tool_name,
+                        "arguments": arguments,
+                        "result": result,
+                        "error": None,
+                    }
+                except Exception as e:
+                    logger.error("Error calling tool %s: %s", tool_name, e, exc_info=True)
+                    return {
+                        "tool_name": tool_name,
+                        "arguments": arguments,
+                        "result": None,
+                        "error": str(e),
+                    }
+
+            # Independent tool calls run concurrently; gather preserves
+            # the LLM's ordering in the results
+            tool_results = list(await asyncio.gather(
+                *(
+                    _invoke(tool_call)
+                    for tool_call in llm_response["tool_calls"]
+                    if tool_call["type"] == "function"
+                )
+            ))
         
         return {
             "response": llm_response.get("content"),
@@ -32,7 +32,29 @@ class OpenAIClient(LLMClient):
             organization=organization,
         )
         self.model = model
-        logger.info(f"Initialized OpenAI client with model {model}")
+        # Cache of {"role": "system", "content": ...} dicts. MCP tool loops
+        # pass the same system message on every call, so reuse the dict
+        # instead of allocating a fresh one per request. Bounded: see
+        # _system_msg.
+        self._system_cache: Dict[str, Dict[str, str]] = {}
+        logger.info("Initialized OpenAI client with model %s", model)
+
+    _SYSTEM_CACHE_MAX = 128
+
+    def _system_msg(self, system_message: str) -> Dict[str, str]:
+        """Get the cached system-message dict for the given text.
+
+        The message text comes from callers (ultimately request bodies),
+        so the cache is capped; when full it is reset rather than
+        retaining every distinct value for the life of the client.
+        """
+        sys_msg = self._system_cache.get(system_message)
+        if sys_msg is None:
+            if len(self._system_cache) >= self._SYSTEM_CACHE_MAX:
+                self._system_cache.clear()
+            sys_msg = {"role": "system", "content": system_message}
+            self._system_cache[system_message] = sys_msg
+        return sys_msg
 
     async def generate(
         self,
@@ -52,14 +74,13 @@ class OpenAIClient(LLMClient):
         Returns:
             The generated text.
         """
-        messages = []
-        
+        user_msg = {"role": "user", "content": prompt}
         if system_message:
-            messages.append({"role": "system", "content": system_message})
-        
-        messages.append({"role": "user", "content": prompt})
+            messages = [self._system_msg(system_message), user_msg]
+        else:
+            messages = [user_msg]
         
-        logger.debug(f"Generating text with prompt: {prompt}")
+        logger.debug("Generating text with prompt: %s", prompt)
         
         try:
             response = await self.client.chat.completions.create(
@@ -70,11 +91,11 @@ class OpenAIClient(LLMClient):
             )
             
             generated_text = response.choices[0].message.content
-            logger.debug(f"Generated text: {generated_text}")
+            logger.debug("Generated text: %s", generated_text)
             
             return generated_text
         except Exception as e:
-            logger.error(f"Error generating text: {e}", exc_info=True)
+            logger.error("Error generating text: %s", e, exc_info=True)
             raise
 
     async def generate_with_tools(
@@ -97,15 +118,14 @@ class OpenAIClient(LLMClient):
         Returns:
             A dictionary containing the generated text and any tool calls.
         """
-        messages = []
-        
+        user_msg = {"role": "user", "content": prompt}
         if system_message:
-            messages.append({"role": "system", "content": system_message})
-        
-        messages.append({"role": "user", "content": prompt})
+            messages = [self._system_msg(system_message), user_msg]
+        else:
+            messages = [user_msg]
         
-        logger.debug(f"Generating text with tools. Prompt: {prompt}")
-        logger.debug(f"Available tools: {tools}")
+        logger.debug("Generating text with tools. Prompt: %s", prompt)
+        logger.debug("Available tools: %s", tools)
         
         try:
             response = await self.client.chat.completions.create(
@@ -124,20 +144,35 @@ class OpenAIClient(LLMClient):
             }
             
             if message.tool_calls:
-                result["tool_calls"] = [
-                    {
-                        "id": tool_call.id,
-                        "type": tool_call.type,
-                        "function": {
-                            "name": tool_call.function.name,
-                            "arguments": tool_call.function.arguments,
-                        },
-                    }
-                    for tool_call in message.tool_calls
-                ]
-                logger.debug(f"Tool calls: {result['tool_calls']}")
+                # The common case is a single tool call; build it inline
+                # rather than paying the list-comprehension frame setup
+                if len(message.tool_calls) == 1:
+                    tc = message.tool_calls[0]
+                    result["tool_calls"] = [
+                        {
+                            "id": tc.id,
+                            "type": tc.type,
+                            "function": {
+                                "name": tc.function.name,
+                                "arguments": tc.function.arguments,
+                            },
+                        }
+                    ]
+                else:
+                    result["tool_calls"] = [
+                        {
+                            "id": tool_call.id,
+                            "type": tool_call.type,
+                            "function": {
+                                "name": tool_call.function.name,
+                                "arguments": tool_call.function.arguments,
+                            },
+                        }
+                        for tool_call in message.tool_calls
+                    ]
+                logger.debug("Tool calls: %s", result["tool_calls"])
             
             return result
         except Exception as e:
-            logger.error(f"Error generating text with tools: {e}", exc_info=True)
+            logger.error("Error generating text with tools: %s", e, exc_info=True)
             raise
@@ -1,9 +1,19 @@
 """API response models."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+def _utcnow() -> datetime:
+    """Timestamp factory for responses.
+
+    ``datetime.now(timezone.utc)`` is slightly cheaper than naive
+    ``datetime.now()`` in CPython (no local-timezone lookup) and gives
+    responses an unambiguous UTC timestamp.
+    """
+    return datetime.now(timezone.utc)
 
 
 class ErrorDetail(BaseModel):
@@ -21,12 +31,10 @@ class ErrorResponse(BaseModel):
     code: int
     message: str
     details: Optional[List[ErrorDetail]] = None
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=_utcnow)
 
-    class Config:
-        """Pydantic config."""
-
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "error",
                 "code": 400,
@@ -38,9 +46,10 @@ class ErrorResponse(BaseModel):
                         "type": "value_error.missing",
                     }
                 ],
-                "timestamp": "2023-05-06T12:34:56.789012",
+                "timestamp": "2023-05-06T12:34:56.789012+00:00",
             }
         }
+    )
 
 
 class APIResponse(BaseModel):
@@ -50,20 +59,19 @@ class APIResponse(BaseModel):
     code: int = 200
     message: str = "OK"
     data: Optional[Any] = None
-    timestamp: datetime = Field(default_factory=datetime.now)
-
-    class Config:
-        """Pydantic config."""
+    timestamp: datetime = Field(default_factory=_utcnow)
 
-        schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "success",
                 "code": 200,
                 "message": "OK",
                 "data": {"id": 1, "name": "Example"},
-                "timestamp": "2023-05-06T12:34:56.789012",
+                "timestamp": "2023-05-06T12:34:56.789012+00:00",
             }
         }
+    )
 
     @classmethod
     def success(
@@ -1,9 +1,117 @@
 """MCP response models."""
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+import json
+from datetime import datetime, timezone
+from functools import lru_cache
+from time import gmtime, time
+from typing import Any, Iterable, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, SkipValidation, TypeAdapter
+
+# msgspec generates a specialized encoder for the fixed response shape and
+# beats pydantic-core's dump_json for schema-known types; it is optional,
+# and the TypeAdapter path below is the fallback.
+try:
+    import msgspec
+
+    class _ResponseStruct(msgspec.Struct, omit_defaults=True):
+        success: bool
+        timestamp: str
+        data: Any = None
+        error: Optional[str] = None
+        error_details: Optional[dict[str, Any]] = None
+
+    _ENCODER = msgspec.json.Encoder()
+except ImportError:  # pragma: no cover - exercised when msgspec is absent
+    _ResponseStruct = None
+    _ENCODER = None
+
+
+def _timestamp() -> str:
+    """Current UTC time as an ISO 8601 string.
+
+    Single helper shared by the response builders so the formatting
+    strategy can change in one place. Formats straight from a struct_time
+    with an f-string, skipping the datetime allocation and isoformat call.
+    """
+    t = time()
+    s = gmtime(t)
+    us = int((t % 1) * 1_000_000)
+    return (
+        f"{s.tm_year:04d}-{s.tm_mon:02d}-{s.tm_mday:02d}"
+        f"T{s.tm_hour:02d}:{s.tm_min:02d}:{s.tm_sec:02d}.{us:06d}Z"
+    )
+
+
+# Skeleton for the cached data-less success response below
+_SUCCESS_TEMPLATE = {"success": True}
+
+# Documentation example, hoisted to module scope so schema generation
+# reuses one dict; the pre-encoded bytes are for anything that wants to
+# serve the example payload without re-serializing it.
+_EXAMPLE = {
+    "success": True,
+    "data": {"result": 42},
+    "error": None,
+    "error_details": None,
+    "timestamp": "2023-05-06T12:34:56.789012",
+}
+_EXAMPLE_JSON = json.dumps(_EXAMPLE).encode()
+
+
+@lru_cache(maxsize=1)
+def _cached_success(second: int) -> dict[str, Any]:
+    """Empty success response for the given whole second.
+
+    Data-less acks vary only in their timestamp, so one dict per second
+    serves every caller within that second (at second resolution).
+    """
+    s = gmtime(second)
+    response_dict = _SUCCESS_TEMPLATE.copy()
+    response_dict["timestamp"] = (
+        f"{s.tm_year:04d}-{s.tm_mon:02d}-{s.tm_mday:02d}"
+        f"T{s.tm_hour:02d}:{s.tm_min:02d}:{s.tm_sec:02d}Z"
+    )
+    return response_dict
+
+# Specialized dict builders: each branch is a bare dict literal with
+# exactly the keys it emits — no template copy, no key-by-key inserts on
+# the hot path. Bound onto MCPResponse below; the docstrings carry the
+# API contract, the class carries the declarative schema.
+def _build_success(data: Any = None) -> dict[str, Any]:
+    """Create a success response.
+
+    Built as a dict literal, bypassing the model: the shape is fixed, so
+    validation plus an exclude_none scan would be pure overhead. Absent
+    fields are omitted rather than emitted as null — ``error`` and
+    ``error_details`` never appear here, and ``data`` only when provided.
+    The data-less form is served from the per-second cache.
+    """
+    if data is None:
+        return dict(_cached_success(int(time())))
+    return {"success": True, "data": data, "timestamp": _timestamp()}
+
+
+def _build_error(
+    error: str, error_details: Optional[dict[str, Any]] = None
+) -> dict[str, Any]:
+    """Create an error response.
+
+    Built as a dict literal for the same reason as ``success_response``;
+    ``data`` never appears here and ``error_details`` only when given.
+    """
+    if error_details is None:
+        return {"success": False, "error": error, "timestamp": _timestamp()}
+    return {
+        "success": False,
+        "error": error,
+        "error_details": error_details,
+        "timestamp": _timestamp(),
+    }
+
+# Serializer for the model-based bytes path, compiled once at import
+# instead of per call. Assigned after the class definition below.
+_ADAPTER: "TypeAdapter[MCPResponse]"
 
 
 class MCPResponse(BaseModel):
@@ -12,50 +120,87 @@ class MCPResponse(BaseModel):
     success: bool = True
     data: Optional[Any] = None
     error: Optional[str] = None
-    error_details: Optional[Dict[str, Any]] = None
-    timestamp: datetime = Field(default_factory=datetime.now)
-
-    class Config:
-        """Pydantic config."""
-
-        schema_extra = {
-            "example": {
-                "success": True,
-                "data": {"result": 42},
-                "error": None,
-                "error_details": None,
-                "timestamp": "2023-05-06T12:34:56.789012",
-            }
-        }
+    # Error payloads are arbitrary and only ever serialized out, so skip
+    # the per-key validation walk pydantic would otherwise run
+    error_details: Optional[SkipValidation[dict[str, Any]]] = None
+    # Filled in by the serialization paths; a default factory would run
+    # datetime.now() on every construction even when the caller supplies
+    # or discards the value
+    timestamp: Optional[datetime] = None
+
+    # Instances are built and immediately dumped, never mutated, so the
+    # model can be frozen
+    model_config = ConfigDict(
+        frozen=True,
+        # Schema generation needs the live dict; see _EXAMPLE_JSON for the
+        # pre-encoded form
+        json_schema_extra={"example": _EXAMPLE},
+    )
+
+    # Specialized builders (defined at module scope above)
+    success_response = staticmethod(_build_success)
+    error_response = staticmethod(_build_error)
+
+    @staticmethod
+    def bulk_success(datas: Iterable[Any]) -> bytes:
+        """Serialize many success responses as one JSON array of bytes.
+
+        Batch path for callers that emit a response per item: the
+        timestamp is formatted once for the whole batch and the array is
+        encoded in a single call, so the per-item cost is one dict
+        literal.
+        """
+        ts = _timestamp()
+        items = [
+            {"success": True, "data": data, "timestamp": ts}
+            if data is not None
+            else {"success": True, "timestamp": ts}
+            for data in datas
+        ]
+        if _ENCODER is not None:
+            return _ENCODER.encode(items)
+        return json.dumps(items).encode()
 
     @classmethod
-    def success_response(cls, data: Any = None) -> Dict[str, Any]:
-        """Create a success response."""
+    def success_json(cls, data: Any = None) -> bytes:
+        """Create a success response serialized straight to JSON bytes.
+
+        pydantic-core serializes the model (datetime included) to bytes in
+        Rust via the precompiled adapter, with no intermediate dict;
+        callers can hand the bytes directly to a raw ``Response``. When
+        msgspec is installed, its specialized encoder is used instead.
+        """
+        if _ENCODER is not None:
+            return _ENCODER.encode(
+                _ResponseStruct(success=True, timestamp=_timestamp(), data=data)
+            )
         response = cls(
-            success=True,
-            data=data,
-            error=None,
-            error_details=None,
+            success=True, data=data, timestamp=datetime.now(timezone.utc)
         )
-        # Convert to dict and remove None values
-        response_dict = response.dict(exclude_none=True)
-        # Convert datetime to ISO format string
-        response_dict["timestamp"] = response_dict["timestamp"].isoformat()
-        return response_dict
+        return _ADAPTER.dump_json(response, exclude_none=True)
 
     @classmethod
-    def error_response(
-        cls, error: str, error_details: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
-        """Create an error response."""
+    def error_json(
+        cls, error: str, error_details: Optional[dict[str, Any]] = None
+    ) -> bytes:
+        """Create an error response serialized straight to JSON bytes."""
+        if _ENCODER is not None:
+            return _ENCODER.encode(
+                _ResponseStruct(
+                    success=False,
+                    timestamp=_timestamp(),
+                    error=error,
+                    error_details=error_details,
+                )
+            )
         response = cls(
             success=False,
-            data=None,
             error=error,
             error_details=error_details,
+            timestamp=datetime.now(timezone.utc),
         )
-        # Convert to dict and remove None values
-        response_dict = response.dict(exclude_none=True)
-        # Convert datetime to ISO format string
-        response_dict["timestamp"] = response_dict["timestamp"].isoformat()
-        return response_dict
+        return _ADAPTER.dump_json(response, exclude_none=True)
+
+
+
+_ADAPTER = TypeAdapter(MCPResponse)